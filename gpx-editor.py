@@ -1,13 +1,32 @@
 import os
 import sys
 import argparse
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from typing import Optional
 import re
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 from datetime import datetime
 import gpxpy
 import gpxpy.gpx
 
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Elements stripped from GPX files in fix mode (extra metadata recorders add)
+STRIP_TAGS = ('extensions', 'cmt', 'desc', 'src', 'sym', 'hdop', 'vdop', 'pdop')
+STRIP_XPATH = ' | '.join(f'//*[local-name()="{tag}"]' for tag in STRIP_TAGS)
+
+# Expected filename format: YYYY-MM-DD NAME (pre-bound .match skips the
+# attribute lookup in the per-file loops)
+FILENAME_MATCH = re.compile(r'^(\d{4}-\d{2}-\d{2})\s+(.+)$').match
+
 
 class GPXAnalyzer:
     """A class to analyze GPX files and extract key information."""
@@ -28,6 +47,11 @@ class GPXAnalyzer:
             dict: Dictionary containing file information, or None if parsing failed.
         """
         try:
+            # Analyze-only mode streams the file instead of building the full
+            # gpxpy tree; the heavy parse is only needed when fixing files
+            if not self.fix_files:
+                return self._fast_analyze(file_path)
+
             with open(file_path, 'r', encoding='utf-8') as gpx_file:
                 gpx = gpxpy.parse(gpx_file)
 
@@ -50,7 +74,7 @@ class GPXAnalyzer:
 
             return file_info
 
-        except gpxpy.gpx.GPXXMLSyntaxException:
+        except (gpxpy.gpx.GPXXMLSyntaxException, ET.ParseError):
             if self.verbose:
                 print(f"!!! Error: {file_path.name} appears to be corrupted or invalid GPX format.")
             return None
@@ -59,6 +83,87 @@ class GPXAnalyzer:
                 print(f"!!! Unexpected error with {file_path.name}: {e}")
             return None
 
+    def _fast_analyze(self, file_path: Path) -> dict:
+        """
+        Stream a GPX file with iterparse, extracting only the metadata that
+        analysis needs (creator, first track/route name, first point time and
+        feature counts) without building the full tree in memory.
+
+        Args:
+            file_path (Path): The path to the GPX file.
+
+        Returns:
+            dict: Dictionary containing file information.
+        """
+        creator = None
+        track_name = None
+        route_name = None
+        point_time = None
+        metadata_time = None
+        track_points = 0
+        waypoints = 0
+        route_points = 0
+
+        stack = []
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            tag = elem.tag.rsplit('}', 1)[-1]  # strip namespace
+
+            if event == 'start':
+                if tag == 'gpx' and creator is None:
+                    creator = elem.get('creator')
+                stack.append(tag)
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else None
+
+            if tag == 'name':
+                if parent == 'trk' and track_name is None:
+                    track_name = elem.text
+                elif parent == 'rte' and route_name is None:
+                    route_name = elem.text
+            elif tag == 'time':
+                if parent == 'trkpt':
+                    if point_time is None:
+                        point_time = elem.text
+                elif parent == 'metadata' and metadata_time is None:
+                    metadata_time = elem.text
+            elif tag == 'trkpt':
+                track_points += 1
+                elem.clear()
+            elif tag == 'wpt':
+                waypoints += 1
+                elem.clear()
+            elif tag == 'rtept':
+                route_points += 1
+                elem.clear()
+
+        file_info = {
+            'filename': file_path.name,
+            'track_name': track_name or route_name or "No track name found",
+            'date': self._format_date(point_time or metadata_time),
+            'creator': creator or "Not specified",
+            'file_path': file_path
+        }
+
+        if self.count_points:
+            file_info.update({
+                'track_points': track_points,
+                'waypoints': waypoints,
+                'route_points': route_points
+            })
+
+        return file_info
+
+    def _format_date(self, time_text: Optional[str]) -> str:
+        """Format an ISO-8601 GPX timestamp as YYYY-MM-DD."""
+        if not time_text:
+            return "No date found"
+        try:
+            return datetime.fromisoformat(time_text.strip().replace('Z', '+00:00')).strftime('%Y-%m-%d')
+        except ValueError:
+            return "No date found"
+
     def _check_filename_format(self, file_info: dict) -> list[str]:
         """Check if filename follows the YYYY-MM-DD NAME format and validate consistency."""
         filename = file_info['filename']
@@ -68,8 +173,7 @@ class GPXAnalyzer:
         filename_no_ext = filename.rsplit('.', 1)[0] if '.' in filename else filename
 
         # YYYY-MM-DD NAME
-        pattern = r'^(\d{4}-\d{2}-\d{2})\s+(.+)$'
-        match = re.match(pattern, filename_no_ext)
+        match = FILENAME_MATCH(filename_no_ext)
 
         if not match:
             warnings.append("📝 Invalid filename format")
@@ -162,65 +266,54 @@ class GPXAnalyzer:
             bool: True if fixing was successful, False otherwise.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as gpx_file:
-                gpx = gpxpy.parse(gpx_file)
-
             # Extract NAME from filename
             filename_no_ext = file_path.stem
-            pattern = r'^(\d{4}-\d{2}-\d{2})\s+(.+)$'
-            match = re.match(pattern, filename_no_ext)
+            match = FILENAME_MATCH(filename_no_ext)
 
             track_name = None
             if match:
                 track_name = match.group(2)
 
-            new_gpx = gpxpy.gpx.GPX()
+            # Prefer the lxml path: pruning the tree in C beats rebuilding
+            # every point as a Python object
+            if LXML_AVAILABLE:
+                return self._fast_fix(file_path, track_name)
+
+            with open(file_path, 'r', encoding='utf-8') as gpx_file:
+                gpx = gpxpy.parse(gpx_file)
+
+            # Emit the simplified document directly as text instead of
+            # rebuilding a gpxpy tree point by point (one object per point)
+            # and going through its XML writer
+            parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+                     '<gpx xmlns="http://www.topografix.com/GPX/1/1" version="1.1" creator="gpx-editor">\n']
 
             if gpx.time:
-                new_gpx.time = gpx.time
+                parts.append(f'  <metadata><time>{_format_gpx_time(gpx.time)}</time></metadata>\n')
 
             for track in gpx.tracks:
-                new_track = gpxpy.gpx.GPXTrack()
-                if track_name:
-                    new_track.name = track_name
-                elif track.name:
-                    new_track.name = track.name
-
+                parts.append('  <trk>\n')
+                name = track_name or track.name
+                if name:
+                    parts.append(f'    <name>{escape(name)}</name>\n')
                 for segment in track.segments:
-                    new_segment = gpxpy.gpx.GPXTrackSegment()
-
-                    for point in segment.points:
-                        new_point = gpxpy.gpx.GPXTrackPoint(
-                            latitude=point.latitude,
-                            longitude=point.longitude,
-                            elevation=point.elevation,
-                            time=point.time
-                        )
-                        new_segment.points.append(new_point)
-
-                    new_track.segments.append(new_segment)
-
-                new_gpx.tracks.append(new_track)
+                    parts.append('    <trkseg>\n')
+                    parts.append(_points_to_xml(segment.points, 'trkpt'))
+                    parts.append('    </trkseg>\n')
+                parts.append('  </trk>\n')
 
             for route in gpx.routes:
-                new_route = gpxpy.gpx.GPXRoute()
-                if track_name:
-                    new_route.name = track_name
-                elif route.name:
-                    new_route.name = route.name
-
-                for point in route.points:
-                    new_point = gpxpy.gpx.GPXRoutePoint(
-                        latitude=point.latitude,
-                        longitude=point.longitude,
-                        elevation=point.elevation
-                    )
-                    new_route.points.append(new_point)
-
-                new_gpx.routes.append(new_route)
+                parts.append('  <rte>\n')
+                name = track_name or route.name
+                if name:
+                    parts.append(f'    <name>{escape(name)}</name>\n')
+                parts.append(_points_to_xml(route.points, 'rtept'))
+                parts.append('  </rte>\n')
+
+            parts.append('</gpx>\n')
 
             with open(file_path, 'w', encoding='utf-8') as gpx_file:
-                gpx_file.write(new_gpx.to_xml())
+                gpx_file.write(''.join(parts))
 
             return True
 
@@ -229,6 +322,100 @@ class GPXAnalyzer:
                 print(f"!!! Error fixing {file_path.name}: {e}")
             return False
 
+    def _fast_fix(self, file_path: Path, track_name: Optional[str]) -> bool:
+        """
+        Fix a GPX file in place using lxml: strip unwanted elements and rewrite
+        track/route names directly on the parsed tree, without rebuilding every
+        point as a Python object.
+
+        Args:
+            file_path (Path): The path to the GPX file.
+            track_name (Optional[str]): Name extracted from the filename, if any.
+
+        Returns:
+            bool: True if fixing was successful.
+        """
+        tree = lxml_etree.parse(str(file_path))
+
+        # Remove extra metadata elements in one C-level pass
+        for bad in tree.xpath(STRIP_XPATH):
+            bad.getparent().remove(bad)
+
+        if track_name:
+            for container in tree.xpath('//*[local-name()="trk" or local-name()="rte"]'):
+                names = [child for child in container if lxml_etree.QName(child).localname == 'name']
+                if names:
+                    names[0].text = track_name
+                else:
+                    namespace = lxml_etree.QName(container).namespace
+                    name_tag = f'{{{namespace}}}name' if namespace else 'name'
+                    name_element = lxml_etree.SubElement(container, name_tag)
+                    name_element.text = track_name
+                    container.insert(0, name_element)
+
+        tree.write(str(file_path), xml_declaration=True, encoding='utf-8')
+        return True
+
+
+def _format_gpx_time(time: datetime) -> str:
+    """Format a timestamp the way GPX expects (ISO-8601, Z suffix)."""
+    return time.isoformat().replace('+00:00', 'Z')
+
+
+def _points_to_xml(points: list, tag: str) -> str:
+    """
+    Emit track/route points as <trkpt>/<rtept> XML text, keeping only
+    lat/lon/elevation (and time for track points).
+
+    Args:
+        points (list): gpxpy track or route points.
+        tag (str): Element tag to emit, 'trkpt' or 'rtept'.
+
+    Returns:
+        str: The serialized point elements.
+    """
+    chunks = []
+    for point in points:
+        body = ''
+        if point.elevation is not None:
+            body += f'<ele>{point.elevation}</ele>'
+        if tag == 'trkpt' and point.time:
+            body += f'<time>{_format_gpx_time(point.time)}</time>'
+        if body:
+            chunks.append(f'      <{tag} lat="{point.latitude}" lon="{point.longitude}">{body}</{tag}>\n')
+        else:
+            chunks.append(f'      <{tag} lat="{point.latitude}" lon="{point.longitude}"/>\n')
+    return ''.join(chunks)
+
+
+def process_gpx_file(args: tuple) -> tuple[str, bool, Optional[bool]]:
+    """
+    Worker function to analyze (and optionally fix) a single GPX file.
+    Runs in a separate process, so any output is captured and returned for
+    the main process to print in order.
+
+    Args:
+        args (tuple): (file_path, verbose, fix_files, count_points).
+
+    Returns:
+        tuple: (captured output, analysis succeeded, fix result or None).
+    """
+    file_path, verbose, fix_files, count_points = args
+    analyzer = GPXAnalyzer(verbose=verbose, fix_files=fix_files, count_points=count_points)
+
+    buffer = io.StringIO()
+    fixed = None
+    with redirect_stdout(buffer):
+        file_info = analyzer.analyze_file(file_path)
+        if file_info:
+            if fix_files:
+                fixed = analyzer.fix_gpx_file(file_path)
+            else:
+                warnings = analyzer._check_filename_format(file_info)
+                analyzer.print_file_info(file_info, warnings)
+
+    return buffer.getvalue(), file_info is not None, fixed
+
 
 def find_gpx_files(directory: Path, recursive: bool = False) -> list[Path]:
     """
@@ -241,10 +428,18 @@ def find_gpx_files(directory: Path, recursive: bool = False) -> list[Path]:
     Returns:
         list[Path]: List of GPX file paths.
     """
-    if recursive:
-        return list(directory.rglob("*.gpx")) + list(directory.rglob("*.GPX"))
-    else:
-        return [f for f in directory.iterdir() if f.suffix.lower() == '.gpx']
+    # Single os.scandir pass with a case-insensitive suffix check, instead of
+    # globbing the tree once per extension casing
+    def walk(path):
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from walk(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith('.gpx'):
+                    yield Path(entry.path)
+
+    return list(walk(directory))
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -324,23 +519,25 @@ def main() -> None:
         print("🚫 No GPX files found in the specified directory.")
         return
 
-    analyzer = GPXAnalyzer(verbose=args.verbose, fix_files=args.fix, count_points=args.count_points)
     successful_analyses = 0
     fixed_files = 0
 
-    for gpx_file in sorted(gpx_files):
-        file_info = analyzer.analyze_file(gpx_file)
-        if file_info:
-            if args.fix:
-                if analyzer.fix_gpx_file(gpx_file):
-                    print(f"🔧 {gpx_file.name}")
-                    fixed_files += 1
-                else:
-                    print(f"❌ {gpx_file.name}")
-            else:
-                warnings = analyzer._check_filename_format(file_info)
-                analyzer.print_file_info(file_info, warnings)
-            successful_analyses += 1
+    # Fan the CPU-bound parsing out across all cores; workers return their
+    # output so it can be printed serially in sorted order
+    jobs = [(gpx_file, args.verbose, args.fix, args.count_points) for gpx_file in sorted(gpx_files)]
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(process_gpx_file, jobs, chunksize=4)
+
+        for (gpx_file, *_), (output, analyzed, fixed) in zip(jobs, results):
+            print(output, end='')
+            if analyzed:
+                if args.fix:
+                    if fixed:
+                        print(f"🔧 {gpx_file.name}")
+                        fixed_files += 1
+                    else:
+                        print(f"❌ {gpx_file.name}")
+                successful_analyses += 1
 
     total_files = len(gpx_files)
     failed_files = total_files - successful_analyses
@@ -15,9 +15,13 @@ CLI arguments:
     -d, --delete  - Delete files that are already uploaded (optional)
 """
 
+import base64
 import hashlib
+import mmap
 import os
-from common import setup_args, make_request, validate_directory, get_all_files, SUPPORTED_EXTENSIONS
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from common import setup_args, make_request, validate_directory, get_supported_files, open_hash_cache
 
 ARGS = setup_args("Check if files are uploaded to Immich",
                  ("photos_folder", {"help": "Path to the folder containing photos to check"}),
@@ -26,45 +30,110 @@ ARGS = setup_args("Check if files are uploaded to Immich",
 DIRECTORY = ARGS.photos_folder
 DELETE_FILES = ARGS.delete
 
-def is_supported_file(filepath):
-    _, ext = os.path.splitext(filepath)
-    return ext.lower() in SUPPORTED_EXTENSIONS
+HASH_WORKERS = 8 # concurrent file reads/hashes
+CACHE_COMMIT_BATCH = 100 # hash cache writes per sqlite commit
+BULK_CHECK_BATCH = 500 # checksums per bulk-upload-check request
+MMAP_HASH_LIMIT = 2 << 30 # 2 GiB, bigger files are hashed in chunks
+
+HASH_CACHE = open_hash_cache()
+HASH_CACHE_LOCK = threading.Lock()
+_pending_cache_writes = 0
 
 def sha1(filepath):
-    hash_sha1 = hashlib.sha1()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= MMAP_HASH_LIMIT:
+            # Hash the whole mapped buffer in one C call: OpenSSL drops the
+            # GIL for the duration, so the hashing threads run in parallel
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return hashlib.sha1(m).hexdigest()
+        # Empty or very large files: stream in 4 MiB chunks
+        hash_sha1 = hashlib.sha1()
+        for chunk in iter(lambda: f.read(4 << 20), b""):
             hash_sha1.update(chunk)
-    return hash_sha1.hexdigest()
+        return hash_sha1.hexdigest()
+
+def cached_sha1(filepath):
+    global _pending_cache_writes
+    st = os.stat(filepath)
+
+    with HASH_CACHE_LOCK:
+        row = HASH_CACHE.execute("SELECT sha1 FROM hashes WHERE path = ? AND mtime_ns = ? AND size = ?",
+                                 (filepath, st.st_mtime_ns, st.st_size)).fetchone()
+    if row:
+        return row[0]
+
+    digest = sha1(filepath)
 
-def search(checksum):
+    with HASH_CACHE_LOCK:
+        HASH_CACHE.execute("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                           (filepath, st.st_mtime_ns, st.st_size, digest))
+        _pending_cache_writes += 1
+        if _pending_cache_writes >= CACHE_COMMIT_BATCH:
+            HASH_CACHE.commit()
+            _pending_cache_writes = 0
+
+    return digest
+
+def fetch_known_assets():
     endpoint = "/api/search/metadata"
-    payload = {"checksum": checksum}
+    known = set()
+    page = 1
     try:
-        response = make_request("POST", endpoint, payload)
-        data = response.json() or {}
-        assets = data.get("assets", {})
-        return {
-            "count": assets.get("count", 0),
-            "items": assets.get("items", []),
-        }
+        while True:
+            response = make_request("POST", endpoint, {"page": page, "size": 1000, "withExif": True})
+            data = response.json() or {}
+            assets = data.get("assets", {})
+            for item in assets.get("items", []):
+                name = item.get("originalFileName")
+                size = (item.get("exifInfo") or {}).get("fileSizeInByte")
+                if name is not None and size is not None:
+                    known.add((name, size))
+            if not assets.get("nextPage"):
+                break
+            page = int(assets["nextPage"])
     except Exception as e:
-        print(f"Search API error: {e}")
-        return {"count": 0, "items": []}
-
-def albums(id):
-    endpoint = f"/api/albums?assetId={id}"
+        print(f"Asset listing API error: {e} - checking all files by hash")
+        return None
+    return known
+
+def bulk_check(files, checksums):
+    endpoint = "/api/assets/bulk-upload-check"
+    results = {}
+    for start in range(0, len(files), BULK_CHECK_BATCH):
+        payload = {"assets": [
+            {"id": path, "checksum": base64.b64encode(bytes.fromhex(digest)).decode()}
+            for path, digest in zip(files[start:start + BULK_CHECK_BATCH],
+                                    checksums[start:start + BULK_CHECK_BATCH])
+        ]}
+        try:
+            response = make_request("POST", endpoint, payload)
+            data = response.json() or {}
+            for item in data.get("results", []):
+                results[item["id"]] = item
+        except Exception as e:
+            print(f"Bulk check API error: {e}")
+    return results
+
+def fetch_album_assets():
+    asset_to_albums = {}
     try:
-        response = make_request("GET", endpoint)
-        return response.json()
+        albums = make_request("GET", "/api/albums").json() or []
+        for album in albums:
+            album_id = album.get("id")
+            if not album_id:
+                continue
+            detail = make_request("GET", f"/api/albums/{album_id}").json() or {}
+            for asset in detail.get("assets", []):
+                asset_to_albums.setdefault(asset["id"], []).append(album.get("albumName", ""))
     except Exception as e:
         print(f"Albums API error: {e}")
-        return []
+    return asset_to_albums
 
 def main():
     validate_directory(DIRECTORY)
 
-    files = [f for f in get_all_files(DIRECTORY) if is_supported_file(f)]
+    files = list(get_supported_files(DIRECTORY))
     deleted_files = []
     found_files = []
 
@@ -74,29 +143,46 @@ def main():
     print(f"🔍 Checking {total_files} files in {DIRECTORY} (recursive){delete_text}")
     print("=" * 80)
 
-    for i, filepath in enumerate(files):
-        filename = os.path.basename(filepath)
-        relative_path = os.path.relpath(filepath, DIRECTORY)
+    paths = [filepath for filepath, _ in files]
+
+    # Files whose (name, size) doesn't appear on the server at all are
+    # certainly new - no point hashing them
+    known = fetch_known_assets()
+    if known is None:
+        candidates = paths
+    else:
+        candidates = [filepath for filepath in paths
+                      if (os.path.basename(filepath), os.path.getsize(filepath)) in known]
+
+    # Hash concurrently, then resolve all checksums in a few bulk requests
+    # instead of one round-trip per file
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as hash_pool:
+        checksums = list(hash_pool.map(cached_sha1, candidates))
+
+    results = bulk_check(candidates, checksums)
+
+    # One pass over the albums instead of one round-trip per duplicate
+    has_duplicates = any(result.get("action") == "reject" and result.get("reason") == "duplicate"
+                         for result in results.values())
+    asset_to_albums = fetch_album_assets() if has_duplicates else {}
+
+    for i, (filepath, relative_path) in enumerate(files):
         progress = f"[{i+1:>{len(str(total_files))}}/{total_files}]"
 
         print(f"{progress} {relative_path:<40} ", end="", flush=True)
 
-        result = search(sha1(filepath))
+        result = results.get(filepath, {})
 
-        if result["count"] == 0:
+        if result.get("action") != "reject" or result.get("reason") != "duplicate":
             print("❌ Not found - keeping file")
             continue
-        elif result["count"] > 1:
-            print("⚠️ Multiple results found - keeping file")
-            continue
 
-        asset = result["items"][0] if result["items"] else {}
-        asset_id = asset.get("id")
+        asset_id = result.get("assetId")
         if not asset_id:
             print("⚠️ Result missing asset id - keeping file")
             continue
 
-        item_albums = [al["albumName"] for al in albums(asset_id)]
+        item_albums = asset_to_albums.get(asset_id, [])
         albums_str = ", ".join(item_albums) if item_albums else "No albums"
 
         if DELETE_FILES:
@@ -110,6 +196,8 @@ def main():
             print(f"✅ Found in [{albums_str}] - would delete")
             found_files.append(relative_path)
 
+    HASH_CACHE.commit() # flush any remaining cached hashes
+
     print("=" * 80)
     if DELETE_FILES:
         if deleted_files:
@@ -1,13 +1,23 @@
 import os
 import requests
 import argparse
+import sqlite3
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter, Retry
 
 SUPPORTED_EXTENSIONS = {
     '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', # images
     '.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v', '.3gp'    # videos
 }
 
+# Shared session: reuses TCP/TLS connections across requests instead of
+# paying a new handshake per call
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                       max_retries=Retry(total=3, backoff_factor=0.5))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 def setup_env():
     global URL, API_KEY
     load_dotenv()
@@ -25,6 +35,9 @@ def setup_env():
         print("Please set API_KEY in your .env file or environment")
         exit(1)
 
+    # Set the common headers once instead of merging them per request
+    SESSION.headers.update({'x-api-key': API_KEY, 'Accept': 'application/json'})
+
     return URL, API_KEY
 
 def setup_args(desc, *args):
@@ -36,30 +49,34 @@ def setup_args(desc, *args):
 def make_request(method, endpoint, payload=None, **kwargs):
     full_url = f"{URL}{endpoint}"
 
-    headers = kwargs.get('headers', {})
-    headers['x-api-key'] = API_KEY
-    headers['Accept'] = 'application/json'
-
     # Handle different payload types
     if payload is not None:
         if method.upper() in ['POST', 'PUT', 'PATCH']:
             if 'files' not in kwargs: # JSON payload
-                headers['Content-Type'] = 'application/json'
                 if isinstance(payload, (dict, list)):
                     kwargs['json'] = payload
                 else:
+                    kwargs.setdefault('headers', {})['Content-Type'] = 'application/json'
                     kwargs['data'] = payload
             else: # File upload with form data
                 kwargs['data'] = payload
         elif method.upper() == 'GET':
             kwargs['params'] = payload
 
-    kwargs['headers'] = headers
-
-    response = requests.request(method, full_url, **kwargs)
+    response = SESSION.request(method, full_url, **kwargs)
     response.raise_for_status()
     return response
 
+def open_hash_cache():
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    # check_same_thread=False: the connection is shared across hashing threads,
+    # callers serialize access with their own lock
+    conn = sqlite3.connect(os.path.join(cache_dir, "immich-uploader.db"), check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS hashes (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha1 TEXT)")
+    conn.commit()
+    return conn
+
 def validate_directory(path):
     if not os.path.exists(path):
         print(f"❌ Directory {path} does not exist.")
@@ -69,14 +86,31 @@ def validate_directory(path):
         exit(1)
     return True
 
-def get_all_files(directory):
+def get_all_files(directory, sort=False):
     files = []
     for root, dirs, filenames in os.walk(directory):
-        dirs.sort()
-        for filename in sorted(filenames):
+        # Sorting is opt-in: callers only index into the list, and sorting
+        # every directory costs O(n log n) per directory on big trees
+        if sort:
+            dirs.sort()
+            filenames = sorted(filenames)
+        for filename in filenames:
             filepath = os.path.join(root, filename)
             if os.path.isfile(filepath):
                 files.append(filepath)
     return files
 
+def get_supported_files(directory, extensions=SUPPORTED_EXTENSIONS):
+    # Generator yielding (path, relative_path): filters by extension during
+    # the walk and computes the relative prefix once per directory, so callers
+    # don't re-derive paths per iteration
+    for root, dirs, filenames in os.walk(directory):
+        rel_root = os.path.relpath(root, directory)
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in extensions:
+                filepath = os.path.join(root, filename)
+                if os.path.isfile(filepath):
+                    relative_path = filename if rel_root == os.curdir else os.path.join(rel_root, filename)
+                    yield filepath, relative_path
+
 setup_env()
@@ -16,7 +16,10 @@ CLI arguments:
 
 import os
 import time
-from common import setup_args, make_request, validate_directory, get_all_files, SUPPORTED_EXTENSIONS
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from common import setup_args, make_request, validate_directory, get_supported_files
 
 ARGS = setup_args("Upload files to Immich",
                  ("photos_folder", {"help": "Path to the folder containing photos to upload"}),
@@ -27,37 +30,48 @@ ALBUM_ID = ARGS.album
 
 MAX_RETRIES = 10
 RETRY_DELAY = 2 # seconds
+MAX_RETRY_DELAY = 30 # seconds, cap for the exponential backoff
+UPLOAD_WORKERS = 4 # concurrent uploads, bounded to not saturate the server
 
-def is_supported_file(filepath):
-    _, ext = os.path.splitext(filepath)
-    return ext.lower() in SUPPORTED_EXTENSIONS
+def iso_utc(timestamp):
+    # C-level ISO-8601 formatting, avoids strftime's format-string parsing
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
 
 def upload_file(filepath):
     endpoint = "/api/assets"
 
+    name = os.path.basename(filepath)
+    st = os.stat(filepath) # one stat call for both timestamps
+
     with open(filepath, 'rb') as f:
         files = {
-            'assetData': (os.path.basename(filepath), f, 'application/octet-stream')
+            'assetData': (name, f, 'application/octet-stream')
         }
         data = {
-            'deviceAssetId': os.path.basename(filepath),
+            'deviceAssetId': name,
             'deviceId': 'upload-script',
-            'fileCreatedAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(os.path.getctime(filepath))),
-            'fileModifiedAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(os.path.getmtime(filepath)))
+            'fileCreatedAt': iso_utc(st.st_ctime),
+            'fileModifiedAt': iso_utc(st.st_mtime)
         }
 
         response = make_request("POST", endpoint, data, files=files)
         return response.json()
 
 def upload_with_retry(filepath, max_retries=MAX_RETRIES):
+    last_exc = None
     for attempt in range(max_retries):
-        time.sleep(RETRY_DELAY * attempt) # exponential backoff
+        if attempt > 0:
+            time.sleep(min(RETRY_DELAY * (2 ** (attempt - 1)), MAX_RETRY_DELAY)) # capped exponential backoff
         try:
             result = upload_file(filepath)
             return True, result
         except Exception as e:
-            continue
-    return False, str(e)
+            last_exc = e
+            # Permanent client errors (4xx except 429) won't get better - stop retrying
+            if isinstance(e, requests.HTTPError) and e.response is not None \
+                    and e.response.status_code < 500 and e.response.status_code != 429:
+                break
+    return False, repr(last_exc)
 
 def add_asset_to_album(album_id, asset_id):
     endpoint = f"/api/albums/{album_id}/assets"
@@ -68,7 +82,7 @@ def add_asset_to_album(album_id, asset_id):
 def main():
     validate_directory(DIRECTORY)
 
-    files = [f for f in get_all_files(DIRECTORY) if is_supported_file(f)]
+    files = list(get_supported_files(DIRECTORY))
 
     total_files = len(files)
     uploaded_files = []
@@ -79,29 +93,33 @@ def main():
     print(f"📤 Uploading {total_files} files from {DIRECTORY} (recursive){album_text}")
     print("=" * 80)
 
-    for i, filepath in enumerate(files):
-        relative_path = os.path.relpath(filepath, DIRECTORY)
-        progress = f"[{i+1:>{len(str(total_files))}}/{total_files}]"
-
-        print(f"{progress} {relative_path:<40} ", end="", flush=True)
-
-        success, result = upload_with_retry(filepath)
-
-        if success:
-            if ALBUM_ID and 'id' in result:
-                try:
-                    add_asset_to_album(ALBUM_ID, result['id'])
-                    print("✅ Uploaded and added to album")
+    # Upload concurrently (bounded) and report each file as it completes;
+    # requests' pooled session is threadsafe across the workers
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+        futures = {executor.submit(upload_with_retry, filepath): relative_path
+                   for filepath, relative_path in files}
+
+        for i, future in enumerate(as_completed(futures)):
+            relative_path = futures[future]
+            progress = f"[{i+1:>{len(str(total_files))}}/{total_files}]"
+
+            success, result = future.result()
+
+            if success:
+                if ALBUM_ID and 'id' in result:
+                    try:
+                        add_asset_to_album(ALBUM_ID, result['id'])
+                        print(f"{progress} {relative_path:<40} ✅ Uploaded and added to album")
+                        uploaded_files.append(relative_path)
+                    except Exception as e:
+                        print(f"{progress} {relative_path:<40} ⚠️ Uploaded but failed to add to album")
+                        warning_album_files.append(relative_path)
+                else:
+                    print(f"{progress} {relative_path:<40} ✅ Uploaded successfully")
                     uploaded_files.append(relative_path)
-                except Exception as e:
-                    print("⚠️ Uploaded but failed to add to album")
-                    warning_album_files.append(relative_path)
             else:
-                print("✅ Uploaded successfully")
-                uploaded_files.append(relative_path)
-        else:
-            print(f"❌ Failed after {MAX_RETRIES} attempts: {result}")
-            failed_files.append((relative_path, result))
+                print(f"{progress} {relative_path:<40} ❌ Failed after {MAX_RETRIES} attempts: {result}")
+                failed_files.append((relative_path, result))
 
     print("=" * 80)
 